@@ -19,18 +19,18 @@ Offline modes (no LLM):
     ``python agent.py --test``  → edge-case tests
 """
 
+import functools
 import sys
-
-from google.adk.agents import Agent
+from typing import Any
 
 try:
     from .tools import (
-        confirm_order, fetch_vendors, filter_vendors,
+        batch_invoke, confirm_order, fetch_vendors, filter_vendors,
         place_order, retrieve_site_rules, store_site_rules,
     )
 except ImportError:
     from tools import (
-        confirm_order, fetch_vendors, filter_vendors,
+        batch_invoke, confirm_order, fetch_vendors, filter_vendors,
         place_order, retrieve_site_rules, store_site_rules,
     )
 
@@ -39,7 +39,7 @@ except ImportError:
 # ---------------------------------------------------------------------------
 
 
-MODEL = gemini-2.0-flash
+MODEL: str = "gemini-2.0-flash"
 
 SYSTEM_PROMPT: str = """\
 You are a procurement agent for construction sites. Your job:
@@ -55,10 +55,11 @@ You are a procurement agent for construction sites. Your job:
    - Material type
    - Quantity
    Then:
-   a) Call retrieve_site_rules(site_name)
-   b) Call fetch_vendors(material)
-   c) Call filter_vendors(vendors, blacklist, budget)
-   d) Analyze the filter_vendors result:
+   a) Call retrieve_site_rules(site_name) AND fetch_vendors(material) in the
+      SAME turn — they are independent, and the runner executes tool calls
+      issued together concurrently, so never wait for one before the other.
+   b) Call filter_vendors(vendors, blacklist, budget)
+   c) Analyze the filter_vendors result:
       - If eligible vendors exist → select the cheapest and call
         place_order(vendor_name, price, quantity, material, site_name,
         approval_limit).
@@ -81,6 +82,11 @@ You are a procurement agent for construction sites. Your job:
      vendor (eligible or over-budget), offer it.  Otherwise tell the user
      no more vendors are available.
 
+5. Batching independent reads:
+   - When multiple independent reads are needed (e.g. vendors for several
+     materials, or rules for several sites), issue a single batch_invoke
+     call with all of them instead of one tool call per turn.
+
 CRITICAL: Never make up vendor prices. Only use data returned by the tools.
 Always explain your reasoning: why you rejected vendors, why you chose one,
 why you need approval, and what the overage is."""
@@ -92,24 +98,46 @@ TOOLS: list = [
     filter_vendors,
     place_order,
     confirm_order,
+    batch_invoke,
 ]
 
 # ---------------------------------------------------------------------------
 # ADK Agent definition  — this is what ``adk run`` / ``adk web`` discovers
 # ---------------------------------------------------------------------------
 
-root_agent = Agent(
-    name="procurement_agent",
-    model=MODEL,
-    description=(
-        "Intelligent procurement agent for construction sites. "
-        "Stores site-specific rules (approval limits, vendor blacklists), "
-        "fetches and filters vendor catalogs, places orders with budget-gate "
-        "logic, and handles human approval for over-budget orders."
-    ),
-    instruction=SYSTEM_PROMPT,
-    tools=TOOLS,
-)
+@functools.lru_cache(maxsize=1)
+def get_root_agent() -> Any:
+    """Build the ADK agent on first use and cache it.
+
+    The ``google.adk`` / ``google.genai`` import chain costs hundreds of
+    milliseconds, so it is deferred until an LLM mode actually needs the
+    agent — ``--demo`` / ``--test`` and the offline CLI never pay it.
+    """
+    from google.adk.agents import Agent
+
+    return Agent(
+        name="procurement_agent",
+        model=MODEL,
+        description=(
+            "Intelligent procurement agent for construction sites. "
+            "Stores site-specific rules (approval limits, vendor blacklists), "
+            "fetches and filters vendor catalogs, places orders with budget-gate "
+            "logic, and handles human approval for over-budget orders."
+        ),
+        instruction=SYSTEM_PROMPT,
+        tools=TOOLS,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Expose ``root_agent`` lazily (PEP 562) so ADK discovery still works.
+
+    ``adk run`` / ``adk web`` look the attribute up by name, which routes
+    through here and triggers the heavy imports only at that point.
+    """
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
@@ -135,17 +163,22 @@ if __name__ == "__main__":
             from demo import demo
         demo()
     else:
-        print("=" * 60)
-        print("  Intelligent Procurement Agent (ADK)")
-        print("=" * 60)
-        print()
-        print("  Use ADK CLI to run this agent interactively:")
-        print("    adk run procurement_agent   (terminal chat)")
-        print("    adk web                     (browser dev UI)")
-        print()
-        print("  Or use offline modes:")
-        print("    python agent.py --demo      (offline demo)")
-        print("    python agent.py --test      (edge-case tests)")
-        print("    python cli.py               (LLM-powered CLI)")
-        print("    python cli.py --offline     (offline CLI)")
-        print("=" * 60)
+        # One write instead of a dozen prints — each print is a separate
+        # format + stdout syscall.
+        sys.stdout.write(
+            "=" * 60 + "\n"
+            "  Intelligent Procurement Agent (ADK)\n"
+            + "=" * 60 + "\n"
+            "\n"
+            "  Use ADK CLI to run this agent interactively:\n"
+            "    adk run procurement_agent   (terminal chat)\n"
+            "    adk web                     (browser dev UI)\n"
+            "\n"
+            "  Or use offline modes:\n"
+            "    python agent.py --demo      (offline demo)\n"
+            "    python agent.py --test      (edge-case tests)\n"
+            "    python cli.py               (LLM-powered CLI)\n"
+            "    python cli.py --offline     (offline CLI)\n"
+            + "=" * 60 + "\n"
+        )
+        sys.stdout.flush()
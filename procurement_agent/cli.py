@@ -7,22 +7,53 @@ Two modes:
 The LLM mode requires a configured ``.env`` with ``GOOGLE_API_KEY``.
 """
 
+import asyncio
 import json
 import sys
 import uuid
 import warnings
-from typing import Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Callable
 
 from colorama import Fore, Style, init as colorama_init
 
+# Colour only interactive terminals.  When stdout is piped (file, CI log)
+# every ANSI escape is wasted bytes and colorama's stdout wrapper adds
+# per-write overhead — swap in empty-string constants instead.
+_COLOR_ENABLED: bool = sys.stdout.isatty()
+
+if not _COLOR_ENABLED:
+    class _NullColors:
+        """Stand-in for colorama's Fore/Style: every attribute is ''."""
+
+        def __getattr__(self, _name: str) -> str:
+            return ""
+
+    Fore = Style = _NullColors()  # type: ignore[assignment]
+
+    def colorama_init(*_args: object, **_kwargs: object) -> None:  # type: ignore[misc] # noqa: F811
+        pass
+
+# Suppress ADK experimental warnings.  Registered once at import —
+# warnings.filterwarnings walks and mutates the global filter list under a
+# lock, so re-registering per chat session is pure overhead.
+warnings.filterwarnings("ignore", category=UserWarning, module=r"google\.adk")
+
 try:
-    from .memory import read_json, read_audit_log, MEMORY_PATH
+    import orjson  # C-extension JSON, used for fast result previews
+except ImportError:  # graceful fallback to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from .memory import flush_audit_log, read_json, iter_audit_log, MEMORY_PATH
     from .tools import (
         confirm_order, fetch_vendors, filter_vendors,
         place_order, retrieve_site_rules, store_site_rules,
     )
 except ImportError:
-    from memory import read_json, read_audit_log, MEMORY_PATH
+    from memory import flush_audit_log, read_json, iter_audit_log, MEMORY_PATH
     from tools import (
         confirm_order, fetch_vendors, filter_vendors,
         place_order, retrieve_site_rules, store_site_rules,
@@ -33,34 +64,46 @@ except ImportError:
 # Colour helpers
 # ---------------------------------------------------------------------------
 
+# Colour prefixes are assembled once at import so each helper does plain
+# string concatenation plus a single stdout write, instead of rebuilding
+# the same f-string template on every call.
+_RESET: str = Style.RESET_ALL
+_TOOL_PFX: str = f"  {Fore.CYAN}[Tool] "
+_OK_PFX: str = f"  {Fore.GREEN}\u2713 "
+_WARN_PFX: str = f"  {Fore.YELLOW}\u26a0 "
+_ERR_PFX: str = f"  {Fore.RED}\u2717 "
+_AGENT_PFX: str = f"\n  {Fore.MAGENTA}Agent: "
+_DIM_PFX: str = f"  {Style.DIM}"
+
+
 def _tool(msg: str) -> None:
     """Tool-call trace — cyan."""
-    print(f"  {Fore.CYAN}[Tool] {msg}{Style.RESET_ALL}")
+    sys.stdout.write(_TOOL_PFX + msg + _RESET + "\n")
 
 
 def _ok(msg: str) -> None:
     """Success — green checkmark."""
-    print(f"  {Fore.GREEN}\u2713 {msg}{Style.RESET_ALL}")
+    sys.stdout.write(_OK_PFX + msg + _RESET + "\n")
 
 
 def _warn(msg: str) -> None:
     """Warning — yellow."""
-    print(f"  {Fore.YELLOW}\u26a0 {msg}{Style.RESET_ALL}")
+    sys.stdout.write(_WARN_PFX + msg + _RESET + "\n")
 
 
 def _err(msg: str) -> None:
     """Error — red cross."""
-    print(f"  {Fore.RED}\u2717 {msg}{Style.RESET_ALL}")
+    sys.stdout.write(_ERR_PFX + msg + _RESET + "\n")
 
 
 def _agent(msg: str) -> None:
     """Agent speech — magenta."""
-    print(f"\n  {Fore.MAGENTA}Agent: {msg}{Style.RESET_ALL}")
+    sys.stdout.write(_AGENT_PFX + msg + _RESET + "\n")
 
 
 def _dim(msg: str) -> None:
     """Muted detail line."""
-    print(f"  {Style.DIM}{msg}{Style.RESET_ALL}")
+    sys.stdout.write(_DIM_PFX + msg + _RESET + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -105,41 +148,48 @@ def cmd_show_rules() -> None:
         print(f"    Blacklist      : {bl_display}")
 
 
-def cmd_show_log() -> None:
-    """Display the audit log with colour-coded event types."""
-    entries = read_audit_log()
-    if not entries:
-        _warn("Audit log is empty.")
-        return
+# Hoisted out of cmd_show_log so the per-entry loop does plain dict probes.
+_LOG_COLORS: dict[str, str] = {
+    "rules_stored": Fore.CYAN,
+    "vendor_rejected": Fore.YELLOW,
+    "vendor_selected": Fore.WHITE,
+    "approval_requested": Fore.YELLOW,
+    "order_placed": Fore.GREEN,
+}
 
-    COLOR_MAP: dict[str, str] = {
-        "rules_stored": Fore.CYAN,
-        "vendor_rejected": Fore.YELLOW,
-        "vendor_selected": Fore.WHITE,
-        "approval_requested": Fore.YELLOW,
-        "order_placed": Fore.GREEN,
-    }
+# Integer detail keys rendered as rupee amounts in the audit log view.
+_INR_KEYS: frozenset[str] = frozenset(("price", "approval_limit", "overage"))
 
-    print()
-    for e in entries:
+
+def cmd_show_log() -> None:
+    """Display the audit log with colour-coded event types.
+
+    Entries are streamed straight from the JSONL file, so memory stays
+    constant however large the log grows and piping through ``head`` shows
+    output immediately.
+    """
+    shown = False
+    for e in iter_audit_log():
+        if not shown:
+            print()
+            shown = True
         ts: str = e.get("timestamp", "")[:19]
         etype: str = e.get("event_type", "")
         site: str = e.get("site_name", "")
         d: dict[str, Any] = e.get("details", {})
-        color: str = COLOR_MAP.get(etype, Fore.WHITE)
+        color: str = _LOG_COLORS.get(etype, Fore.WHITE)
 
-        parts: list[str] = []
-        for k, v in d.items():
-            if isinstance(v, int) and k in ("price", "approval_limit", "overage"):
-                parts.append(f"{k}=\u20b9{v:,}")
-            elif isinstance(v, list):
-                parts.append(f"{k}={v}")
-            else:
-                parts.append(f"{k}={v}")
-        detail = ", ".join(parts)
+        detail = ", ".join(
+            f"{k}=\u20b9{v:,}" if k in _INR_KEYS and isinstance(v, int)
+            else f"{k}={v}"
+            for k, v in d.items()
+        )
+        sys.stdout.write(
+            f"  {color}[{ts}]  {etype:<22} | {site}{_RESET}\n    {detail}\n"
+        )
 
-        print(f"  {color}[{ts}]  {etype:<22} | {site}{Style.RESET_ALL}")
-        print(f"    {detail}")
+    if not shown:
+        _warn("Audit log is empty.")
 
 
 # ===================================================================
@@ -155,18 +205,37 @@ LIVE_HELP = (
 )
 
 
+# Startup banners are assembled once so each mode renders its header and
+# help block with a single stdout write instead of a cluster of prints.
+_BANNER_LIVE: str = (
+    f"\n{Fore.CYAN}{'=' * 60}\n"
+    "  Intelligent Procurement Agent \u2014 Live Chat\n"
+    f"{'=' * 60}{Style.RESET_ALL}\n"
+    f"\n{LIVE_HELP}\n\n"
+)
+
+
+def _format_str_arg(v: str) -> str:
+    return repr(v[:47] + "...") if len(v) > 50 else repr(v)
+
+
+def _format_list_arg(v: list) -> str:
+    return f"[{len(v)} items]" if len(str(v)) > 60 else repr(v)
+
+
+# Per-type arg formatters — one dict probe on type(v) replaces the
+# isinstance ladder that ran for every kwarg of every tool call.
+_ARG_FORMATTERS: dict[type, Any] = {
+    str: _format_str_arg,
+    list: _format_list_arg,
+}
+
+
 def _format_args(args: dict[str, Any]) -> str:
     """Format function-call args for compact display, truncating long values."""
-    pieces: list[str] = []
-    for k, v in args.items():
-        if isinstance(v, str) and len(v) > 50:
-            v_str = repr(v[:47] + "...")
-        elif isinstance(v, list) and len(str(v)) > 60:
-            v_str = f"[{len(v)} items]"
-        else:
-            v_str = repr(v)
-        pieces.append(f"{k}={v_str}")
-    return ", ".join(pieces)
+    return ", ".join(
+        f"{k}={_ARG_FORMATTERS.get(type(v), repr)(v)}" for k, v in args.items()
+    )
 
 
 def _display_event(event: Any) -> None:
@@ -177,79 +246,65 @@ def _display_event(event: Any) -> None:
       * **function_response** — tool result summary (shown dim)
       * **text** — agent response (shown in magenta)
     """
-    content = getattr(event, "content", None)
-    if not content:
-        return
-    event_parts = getattr(content, "parts", None)
-    if not event_parts:
-        return
-
-    # Skip echoed user messages
-    author = getattr(event, "author", "")
-    if author == "user":
+    # ADK events are pydantic models whose fields always exist (defaulting
+    # to None), so direct attribute access is safe and skips the getattr
+    # dispatch per field; anything that isn't event-shaped is ignored.
+    try:
+        content = event.content
+        if not content or not content.parts:
+            return
+        if event.author == "user":
+            return  # skip echoed user messages
+
+        for part in content.parts:
+            fc = part.function_call
+            if fc is not None:
+                _tool(f"{fc.name or '?'}({_format_args(fc.args or {})})")
+                continue
+
+            fr = part.function_response
+            if fr is not None:
+                resp = fr.response or {}
+                try:
+                    if orjson is not None:
+                        preview = orjson.dumps(resp, default=str).decode("utf-8")
+                    else:
+                        preview = json.dumps(resp, ensure_ascii=False, default=str)
+                except (TypeError, ValueError):
+                    preview = str(resp)
+                if len(preview) > 150:
+                    preview = preview[:147] + "..."
+                _dim(f"  \u2192 {preview}")
+                continue
+
+            text = part.text
+            if text:
+                stripped = text.strip()
+                if stripped:
+                    _agent(stripped)
+    except AttributeError:
         return
 
-    for part in event_parts:
-        fc = getattr(part, "function_call", None)
-        fr = getattr(part, "function_response", None)
-        text = getattr(part, "text", None)
 
-        if fc:
-            name = getattr(fc, "name", "?")
-            args = getattr(fc, "args", None) or {}
-            _tool(f"{name}({_format_args(args)})")
+async def _chat_loop(runner: Any, user_id: str, session_id: str) -> None:
+    """Async chat loop driving ``runner.run_async``.
 
-        elif fr:
-            resp = getattr(fr, "response", None) or {}
-            try:
-                preview = json.dumps(resp, ensure_ascii=False, default=str)
-            except (TypeError, ValueError):
-                preview = str(resp)
-            if len(preview) > 150:
-                preview = preview[:147] + "..."
-            _dim(f"  \u2192 {preview}")
-
-        elif text:
-            stripped = text.strip()
-            if stripped:
-                _agent(stripped)
-
-
-def run_live() -> None:
-    """LLM-powered interactive chat using ADK InMemoryRunner.
-
-    Each user message is sent to the live Gemini model via the ADK Runner.
-    Tool calls (fetch_vendors, filter_vendors, etc.) happen automatically
-    and are displayed in real time.
+    ``input()`` runs in a worker thread via ``asyncio.to_thread`` so the
+    event loop stays free while the user types, and events stream to the
+    terminal as they arrive \u2014 tool calls issued in the same turn overlap
+    their I/O instead of serialising behind a blocking generator.
     """
-    # Suppress ADK experimental warnings
-    warnings.filterwarnings("ignore", category=UserWarning, module=r"google\.adk")
-
-    try:
-        from google.adk.runners import InMemoryRunner  # type: ignore[import-untyped]
-        from google.genai.types import Content, Part    # type: ignore[import-untyped]
-        try:
-            from .agent import root_agent
-        except ImportError:
-            from agent import root_agent
-    except ImportError as exc:
-        _err(f"Cannot start live mode: {exc}")
-        _warn("Install dependencies: pip install google-adk")
-        _warn("Or use offline mode: python cli.py --offline")
-        return
+    from google.genai.types import Content, Part  # type: ignore[import-untyped]
 
-    runner = InMemoryRunner(agent=root_agent, app_name="procurement_cli")
-    session_id = f"cli-{uuid.uuid4().hex[:8]}"
-    user_id = "cli-user"
-
-    print(f"\n{Fore.CYAN}{'=' * 60}")
-    print("  Intelligent Procurement Agent \u2014 Live Chat")
-    print(f"{'=' * 60}{Style.RESET_ALL}")
-    print(f"\n{LIVE_HELP}\n")
+    await runner.session_service.create_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id,
+    )
 
     while True:
         try:
-            raw = input(f"{Fore.GREEN}> {Style.RESET_ALL}").strip()
+            raw = (await asyncio.to_thread(
+                input, f"{Fore.GREEN}> {Style.RESET_ALL}",
+            )).strip()
         except (EOFError, KeyboardInterrupt):
             print(f"\n{Fore.CYAN}Goodbye.{Style.RESET_ALL}")
             break
@@ -273,12 +328,12 @@ def run_live() -> None:
             print(f"\n{LIVE_HELP}\n")
             continue
 
-        # Send to ADK agent
+        # Send to ADK agent, streaming events as they arrive
         msg = Content(parts=[Part(text=raw)], role="user")
 
         print()
         try:
-            for event in runner.run(
+            async for event in runner.run_async(
                 user_id=user_id,
                 session_id=session_id,
                 new_message=msg,
@@ -290,6 +345,38 @@ def run_live() -> None:
         print()
 
 
+def run_live() -> None:
+    """LLM-powered interactive chat using ADK InMemoryRunner.
+
+    Each user message is sent to the live Gemini model via the ADK Runner.
+    Tool calls (fetch_vendors, filter_vendors, etc.) happen automatically
+    and are displayed in real time.
+    """
+    try:
+        from google.adk.runners import InMemoryRunner  # type: ignore[import-untyped]
+        try:
+            from .agent import get_root_agent
+        except ImportError:
+            from agent import get_root_agent
+    except ImportError as exc:
+        _err(f"Cannot start live mode: {exc}")
+        _warn("Install dependencies: pip install google-adk")
+        _warn("Or use offline mode: python cli.py --offline")
+        return
+
+    runner = InMemoryRunner(agent=get_root_agent(), app_name="procurement_cli")
+    session_id = f"cli-{uuid.uuid4().hex[:8]}"
+    user_id = "cli-user"
+
+    sys.stdout.write(_BANNER_LIVE)
+    sys.stdout.flush()
+
+    try:
+        asyncio.run(_chat_loop(runner, user_id, session_id))
+    except KeyboardInterrupt:
+        print(f"\n{Fore.CYAN}Goodbye.{Style.RESET_ALL}")
+
+
 # ===================================================================
 # OFFLINE MODE  (calls tools directly — no LLM needed)
 # ===================================================================
@@ -303,6 +390,13 @@ OFFLINE_HELP = (
     f"  {Fore.WHITE}exit{Style.RESET_ALL}       \u2014 quit"
 )
 
+_BANNER_OFFLINE: str = (
+    f"\n{Fore.CYAN}{'=' * 60}\n"
+    "  Intelligent Procurement Agent \u2014 Offline CLI\n"
+    f"{'=' * 60}{Style.RESET_ALL}\n"
+    f"\n{OFFLINE_HELP}\n\n"
+)
+
 
 def cmd_set_rules() -> None:
     """Prompt for site name, approval limit, blacklist, then store."""
@@ -331,6 +425,15 @@ def cmd_set_rules() -> None:
 
 def cmd_order() -> None:
     """Run the full procurement pipeline with real-time tool tracing."""
+    try:
+        _order_pipeline()
+    finally:
+        # Persist any buffered audit events so ``show log`` immediately
+        # reflects this order.
+        flush_audit_log()
+
+
+def _order_pipeline() -> None:
     print()
     site = _ask("Site: ")
     if not site:
@@ -349,17 +452,21 @@ def cmd_order() -> None:
     # ---- agent thinking ----
     print(f"\n  {Fore.CYAN}[Agent thinking...]{Style.RESET_ALL}")
 
-    # Step 1 — rules
+    # Steps 1+2 — rules and vendors are independent reads (separate JSON
+    # files), so dispatch them concurrently; threads overlap the syscalls.
     _tool(f"retrieve_site_rules({site!r})")
-    rules = retrieve_site_rules(site)
+    _tool(f"fetch_vendors({material!r})")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_rules = ex.submit(retrieve_site_rules, site)
+        fut_vendors = ex.submit(fetch_vendors, material)
+        rules = fut_rules.result()
+        vendors = fut_vendors.result()
+
     if "error" in rules:
         _err(rules["error"])
         return
     _dim(f"  limit=\u20b9{rules['approval_limit']:,}  blacklist={rules['vendor_blacklist']}")
 
-    # Step 2 — vendors (read dynamically from mock_vendors.json)
-    _tool(f"fetch_vendors({material!r})")
-    vendors = fetch_vendors(material)
     if not vendors:
         _warn(f"No vendors found for material '{material}'.")
         return
@@ -390,7 +497,7 @@ def cmd_order() -> None:
         vendor_name: str = filtered["eligible"][0]["name"]
         price: int = filtered["eligible"][0]["price_per_100_bags_inr"]
     elif filtered["over_budget"]:
-        cheapest_ob = min(filtered["over_budget"], key=lambda x: x["price"])
+        cheapest_ob = min(filtered["over_budget"], key=itemgetter("price"))
         vendor_name = cheapest_ob["vendor"]
         price = cheapest_ob["price"]
     else:
@@ -440,11 +547,19 @@ def _handle_approval(
         print(f"  {Fore.YELLOW}{line}{Style.RESET_ALL}")
     print(f"  {bar}")
 
-    # Build a queue of remaining over-budget vendors (cheapest first),
-    # excluding the one we just offered.
-    remaining: list[dict[str, Any]] = sorted(
-        [o for o in filtered["over_budget"] if o["vendor"] != vendor_name],
-        key=lambda x: x["price"],
+    # Build a queue of remaining over-budget vendors, excluding the one we
+    # just offered.  filter_vendors guarantees over_budget is sorted
+    # cheapest-first, so a plain filter preserves price order; the deque
+    # gives O(1) front-pops where list.pop(0) would shift every element.
+    remaining: deque[dict[str, Any]] = deque(
+        o for o in filtered["over_budget"] if o["vendor"] != vendor_name
+    )
+
+    # The site's approval limit is invariant for this session — look it up
+    # once rather than re-reading the rules for every rejected vendor.
+    rules = retrieve_site_rules(site)
+    site_limit: int | None = (
+        rules["approval_limit"] if "error" not in rules else None
     )
 
     # --- approval loop ---
@@ -470,7 +585,7 @@ def _handle_approval(
             return
 
         # Offer the next cheapest
-        nxt = remaining.pop(0)
+        nxt = remaining.popleft()
         current_vendor = nxt["vendor"]
         current_price = nxt["price"]
         _agent(
@@ -478,11 +593,8 @@ def _handle_approval(
             f"at \u20b9{current_price:,}. "
             f"This also exceeds the budget."
         )
-        # Recalculate overage from the site's actual budget
-        rules = retrieve_site_rules(site)
-        budget_val: int = current_price
-        if "error" not in rules:
-            budget_val = rules["approval_limit"]
+        # Recalculate overage from the hoisted site budget
+        budget_val: int = site_limit if site_limit is not None else current_price
         overage = current_price - budget_val
         pct = round((overage / budget_val) * 100, 1) if budget_val else 0
         print()
@@ -495,19 +607,20 @@ def _handle_approval(
         print(f"  {bar}{Style.RESET_ALL}")
 
 
+# Built once at import — run_offline used to reallocate this dict (and
+# rebind the function references) on every invocation.
+_OFFLINE_COMMANDS: dict[str, Callable[[], None]] = {
+    "set rules": cmd_set_rules,
+    "order":     cmd_order,
+    "show rules": cmd_show_rules,
+    "show log":  cmd_show_log,
+}
+
+
 def run_offline() -> None:
     """Offline command-based interaction (calls tools directly, no LLM)."""
-    COMMANDS: dict[str, Any] = {
-        "set rules": cmd_set_rules,
-        "order":     cmd_order,
-        "show rules": cmd_show_rules,
-        "show log":  cmd_show_log,
-    }
-
-    print(f"\n{Fore.CYAN}{'=' * 60}")
-    print("  Intelligent Procurement Agent \u2014 Offline CLI")
-    print(f"{'=' * 60}{Style.RESET_ALL}")
-    print(f"\n{OFFLINE_HELP}\n")
+    sys.stdout.write(_BANNER_OFFLINE)
+    sys.stdout.flush()
 
     while True:
         try:
@@ -525,9 +638,9 @@ def run_offline() -> None:
             break
         elif cmd in ("help", "?"):
             print(f"\n{OFFLINE_HELP}")
-        elif cmd in COMMANDS:
+        elif (handler := _OFFLINE_COMMANDS.get(cmd)) is not None:
             try:
-                COMMANDS[cmd]()
+                handler()
             except (EOFError, KeyboardInterrupt):
                 print(f"\n{Fore.CYAN}(cancelled){Style.RESET_ALL}")
             except Exception as exc:
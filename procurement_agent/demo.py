@@ -9,19 +9,25 @@ Run:
     ``python agent.py --test``  → same tests (dispatches here)
 """
 
-import json
+import re
 import sys
-from collections import Counter
-from typing import Any
+from operator import itemgetter
+from typing import Any, Callable
 
 try:
-    from .memory import clear_audit_log, read_audit_log, write_json, MEMORY_PATH
+    from .memory import (
+        clear_audit_log, clear_orders, flush_audit_log, read_audit_log,
+        write_json, AUDIT_LOG_PATH, MEMORY_PATH,
+    )
     from .tools import (
         confirm_order, fetch_vendors, filter_vendors,
         place_order, retrieve_site_rules, store_site_rules,
     )
 except ImportError:
-    from memory import clear_audit_log, read_audit_log, write_json, MEMORY_PATH
+    from memory import (
+        clear_audit_log, clear_orders, flush_audit_log, read_audit_log,
+        write_json, AUDIT_LOG_PATH, MEMORY_PATH,
+    )
     from tools import (
         confirm_order, fetch_vendors, filter_vendors,
         place_order, retrieve_site_rules, store_site_rules,
@@ -32,6 +38,53 @@ except ImportError:
 # Audit log summary printer
 # ---------------------------------------------------------------------------
 
+# Per-event-type body formatters.  One dict lookup per entry replaces the
+# if/elif chain that compared the event type against every known value;
+# new event types extend the table instead of growing a ladder.
+# Each formatter subscripts its known schema directly — no per-field
+# .get() call and default allocation; the caller catches KeyError once
+# for the rare malformed entry.
+_FORMATTERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "rules_stored": lambda d: (
+        f"approval_limit=₹{d['approval_limit']:,}, "
+        f"blacklist={d['vendor_blacklist']}"
+    ),
+    "vendor_rejected": lambda d: (
+        f"{d['vendor']}: {d['reason']} (₹{d['price']:,})"
+    ),
+    "vendor_selected": lambda d: (
+        f"{d['vendor']} at ₹{d['price']:,} — "
+        f"{d['quantity']} bags {d['material']}"
+    ),
+    "approval_requested": lambda d: (
+        f"{d['vendor']}: ₹{d['price']:,} exceeds "
+        f"limit ₹{d['approval_limit']:,} "
+        f"(overage ₹{d['overage']:,} / {d['overage_pct']}%)"
+    ),
+    "order_placed": lambda d: (
+        f"{d['vendor']}: {d['quantity']} bags "
+        f"{d['material']} at ₹{d['price']:,} "
+        f"({'human-approved' if d['approval'] == 'human' else 'auto-approved'})"
+    ),
+}
+
+
+def _default_format(d: dict[str, Any]) -> str:
+    """Fallback body for unknown event types.
+
+    ``repr`` is a single C-level call and reads just as well for a small
+    details dict; nothing parses these summary lines back.
+    """
+    return repr(d) if d else ""
+
+
+# Display order for the decisions-summary section, built once.
+_EVENT_ORDER: tuple[str, ...] = (
+    "rules_stored", "vendor_rejected", "vendor_selected",
+    "approval_requested", "order_placed",
+)
+
+
 def _print_audit_summary() -> None:
     """Read ``audit_log.jsonl`` and print a formatted summary.
 
@@ -46,84 +99,75 @@ def _print_audit_summary() -> None:
         print("  (audit log is empty)")
         return
 
-    # --- 1. Chronological log ---
-    print("-" * 58)
+    # One traversal feeds every section: the chronological lines, the
+    # rejected list, the per-type counters and the final-outcome
+    # trackers.  The log used to be walked four separate times.
+    # Every line lands in ``out`` and is emitted as one stdout write at
+    # the end — dozens of per-line print() syscalls otherwise.
+    out: list[str] = ["-" * 58]
+    rejected: list[dict[str, Any]] = []
+    # Plain dict beats Counter here: the keyspace is tiny and dict.get
+    # skips Counter's __missing__ machinery.
+    counts: dict[str, int] = {}
+    last_placed: dict[str, Any] | None = None
+    saw_approval = False
+
     for e in entries:
         ts: str = e.get("timestamp", "")[:19]
         etype: str = e.get("event_type", "")
         site: str = e.get("site_name", "")
         d: dict[str, Any] = e.get("details", {})
 
-        if etype == "rules_stored":
-            body = (
-                f"approval_limit=₹{d.get('approval_limit', 0):,}, "
-                f"blacklist={d.get('vendor_blacklist', [])}"
-            )
-        elif etype == "vendor_rejected":
-            body = f"{d.get('vendor')}: {d.get('reason')} (₹{d.get('price', 0):,})"
-        elif etype == "vendor_selected":
-            body = (
-                f"{d.get('vendor')} at ₹{d.get('price', 0):,} — "
-                f"{d.get('quantity')} bags {d.get('material')}"
-            )
-        elif etype == "approval_requested":
-            body = (
-                f"{d.get('vendor')}: ₹{d.get('price', 0):,} exceeds "
-                f"limit ₹{d.get('approval_limit', 0):,} "
-                f"(overage ₹{d.get('overage', 0):,} / {d.get('overage_pct', 0)}%)"
-            )
+        counts[etype] = counts.get(etype, 0) + 1
+        if etype == "vendor_rejected":
+            rejected.append(d)
         elif etype == "order_placed":
-            approval_mode = "human-approved" if d.get("approval") == "human" else "auto-approved"
-            body = (
-                f"{d.get('vendor')}: {d.get('quantity')} bags "
-                f"{d.get('material')} at ₹{d.get('price', 0):,} ({approval_mode})"
-            )
-        else:
-            body = json.dumps(d) if d else ""
+            last_placed = d
+        elif etype == "approval_requested":
+            saw_approval = True
+
+        try:
+            body = _FORMATTERS.get(etype, _default_format)(d)
+        except KeyError:
+            body = repr(d)  # malformed entry — show it raw
 
-        print(f"  [{ts}]  {etype:<22} | {site}")
-        print(f"    {body}")
+        # One %-format per entry: a single C-level format call instead of
+        # two f-strings with their own format-spec passes.
+        out.append("  [%s]  %-22s | %s\n    %s" % (ts, etype, site, body))
 
     # --- 2. Vendors considered ---
-    rejected = [e for e in entries if e["event_type"] == "vendor_rejected"]
     if rejected:
-        print()
-        print("  Vendors rejected:")
-        for r in rejected:
-            d = r["details"]
-            print(f"    - {d['vendor']:20s}  ₹{d['price']:>7,}  {d['reason']}")
+        out.append("")
+        out.append("  Vendors rejected:")
+        for d in rejected:
+            out.append(f"    - {d['vendor']:20s}  ₹{d['price']:>7,}  {d['reason']}")
 
     # --- 3. Counters ---
-    counts: Counter = Counter(e["event_type"] for e in entries)
-    print()
-    print("  Decisions summary:")
-    for etype in [
-        "rules_stored", "vendor_rejected", "vendor_selected",
-        "approval_requested", "order_placed",
-    ]:
-        if counts[etype]:
-            print(f"    {etype:<22} {counts[etype]}")
-    print(f"    {'total':<22} {len(entries)}")
+    out.append("")
+    out.append("  Decisions summary:")
+    for etype in _EVENT_ORDER:
+        n = counts.get(etype, 0)
+        if n:
+            out.append(f"    {etype:<22} {n}")
+    out.append(f"    {'total':<22} {len(entries)}")
 
     # --- 4. Final outcome ---
-    placed = [e for e in entries if e["event_type"] == "order_placed"]
-    if placed:
-        last = placed[-1]["details"]
-        mode = "human-approved" if last.get("approval") == "human" else "auto-approved"
-        print()
-        print(
-            f"  Final outcome: Order placed with {last['vendor']} — "
-            f"{last['quantity']} bags {last['material']} "
-            f"at ₹{last['price']:,} ({mode})"
+    if last_placed is not None:
+        mode = "human-approved" if last_placed.get("approval") == "human" else "auto-approved"
+        out.append("")
+        out.append(
+            f"  Final outcome: Order placed with {last_placed['vendor']} — "
+            f"{last_placed['quantity']} bags {last_placed['material']} "
+            f"at ₹{last_placed['price']:,} ({mode})"
         )
+    elif saw_approval:
+        out.append("")
+        out.append("  Final outcome: Awaiting human approval")
     else:
-        approvals = [e for e in entries if e["event_type"] == "approval_requested"]
-        if approvals:
-            print()
-            print("  Final outcome: Awaiting human approval")
-        else:
-            print()
-            print("  Final outcome: No order placed")
+        out.append("")
+        out.append("  Final outcome: No order placed")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -154,6 +198,7 @@ def demo() -> None:
 
     # Reset state
     clear_audit_log()
+    clear_orders()
     write_json(MEMORY_PATH, {})
 
     print("=" * 60)
@@ -176,15 +221,20 @@ def demo() -> None:
     print(f"  Rules loaded: {rules}")
 
     vendors = fetch_vendors(material)
-    print(f"  Vendors found: {len(vendors)}")
-    for v in vendors:
-        print(f"    {v['name']:20s}  ₹{v['price_per_100_bags_inr']:>7,}  "
-              f"{v['delivery_days']}d  stock={'yes' if v['in_stock'] else 'no'}")
-
-    # Turn 2b — filter
-    filtered = filter_vendors(
-        vendors, rules["vendor_blacklist"], rules["approval_limit"], site,
+    # One write for the whole vendor table instead of a print per row.
+    vendor_lines = [f"  Vendors found: {len(vendors)}"]
+    vendor_lines.extend(
+        f"    {v['name']:20s}  ₹{v['price_per_100_bags_inr']:>7,}  "
+        f"{v['delivery_days']}d  stock={'yes' if v['in_stock'] else 'no'}"
+        for v in vendors
     )
+    sys.stdout.write("\n".join(vendor_lines) + "\n")
+
+    # Turn 2b — filter.  frozenset gives the blacklist O(1) membership
+    # downstream; the rules fields are hoisted out of the call expression.
+    bl = frozenset(rules["vendor_blacklist"])
+    budget = rules["approval_limit"]
+    filtered = filter_vendors(vendors, bl, budget, site)
     print(f"\n  Filter results:")
     print(f"    Eligible   : {[v['name'] for v in filtered['eligible']] or '(none)'}")
     print(f"    Rejected   : {[r['vendor'] for r in filtered['rejected']] or '(none)'}")
@@ -196,7 +246,7 @@ def demo() -> None:
         vendor_name = chosen["name"]
         price = chosen["price_per_100_bags_inr"]
     elif filtered["over_budget"]:
-        cheapest_ob = min(filtered["over_budget"], key=lambda x: x["price"])
+        cheapest_ob = min(filtered["over_budget"], key=itemgetter("price"))
         vendor_name = cheapest_ob["vendor"]
         price = cheapest_ob["price"]
     else:
@@ -233,6 +283,11 @@ def demo() -> None:
 # Edge-case test harness
 # ---------------------------------------------------------------------------
 
+# A vendor_rejected line whose reason mentions glass, matched on the raw
+# log bytes — compact (orjson) and spaced (stdlib json) layouts both fit.
+_GLASS_WARNING_RE = re.compile(rb'"event_type":\s*"vendor_rejected"[^\n]*glass')
+
+
 def test_edge_cases() -> None:
     """Exercise four failure modes and print whether each is handled gracefully.
 
@@ -258,6 +313,7 @@ def test_edge_cases() -> None:
 
     # Reset state
     clear_audit_log()
+    clear_orders()
     write_json(MEMORY_PATH, {})
 
     print("=" * 60)
@@ -279,12 +335,14 @@ def test_edge_cases() -> None:
     vendors = fetch_vendors("glass")
     is_empty = isinstance(vendors, list) and len(vendors) == 0
     _check("fetch_vendors returns empty list", is_empty, f"Got {len(vendors)} vendor(s) for 'glass'")
-    log = read_audit_log()
-    warning_logged = any(
-        e["event_type"] == "vendor_rejected"
-        and "glass" in e.get("details", {}).get("reason", "")
-        for e in log
-    )
+    # The question is a substring match, so skip JSON parsing entirely
+    # and scan the raw log bytes once.
+    flush_audit_log()
+    try:
+        raw = AUDIT_LOG_PATH.read_bytes()
+    except OSError:
+        raw = b""
+    warning_logged = _GLASS_WARNING_RE.search(raw) is not None
     _check("Warning logged to audit_log.jsonl", warning_logged, "Audit entry: material 'glass' not found")
 
     # Test 3 — All vendors blacklisted
@@ -292,7 +350,7 @@ def test_edge_cases() -> None:
     print("  Test 3: Filter vendors when every vendor is blacklisted")
     print(SEP)
     cement_vendors = fetch_vendors("cement")
-    all_names = [v["name"] for v in cement_vendors]
+    all_names = frozenset(v["name"] for v in cement_vendors)
     filtered = filter_vendors(cement_vendors, all_names, 100_000, "Test-Site-BL")
     all_rejected = (
         len(filtered["eligible"]) == 0
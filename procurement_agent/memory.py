@@ -1,8 +1,9 @@
 """Persistence layer for the intelligent procurement agent.
 
-Manages file I/O for three data stores:
+Manages file I/O for four data stores:
 
-* ``memory_store.json``  — site rules and confirmed orders (structured JSON)
+* ``memory_store.json``  — site rules (structured JSON)
+* ``orders.ndjson``      — confirmed-order history (append-only NDJSON)
 * ``mock_vendors.json``  — vendor catalog (read-only JSON)
 * ``audit_log.jsonl``    — append-only decision audit trail (JSONL)
 
@@ -11,10 +12,48 @@ with robust error handling.  Tool functions in ``tools.py`` import from
 this module; they never touch the filesystem directly.
 """
 
+import atexit
 import json
-from datetime import datetime, timezone
+import mmap
+import os
+import queue
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+
+try:
+    import orjson  # C-extension JSON, 2-10x faster than stdlib
+except ImportError:  # graceful fallback to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(buf: bytes | str) -> Any:
+    """Parse JSON with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _dumps_indented(data: dict[str, Any]) -> bytes:
+    """Serialise *data* as 2-space-indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(entry: dict[str, Any]) -> bytes:
+    """Serialise one audit entry as a newline-terminated JSONL record.
+
+    Both branches emit compact separators, so log lines are byte-identical
+    regardless of whether orjson is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return (
+        json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
 
 # ---------------------------------------------------------------------------
 # Path constants  (all relative to this package directory)
@@ -26,7 +65,10 @@ VENDORS_PATH: Path = _BASE / "mock_vendors.json"
 """Read-only vendor catalog."""
 
 MEMORY_PATH: Path = _BASE / "memory_store.json"
-"""Structured store for site rules and orders."""
+"""Structured store for site rules."""
+
+ORDERS_PATH: Path = _BASE / "orders.ndjson"
+"""Append-only confirmed-order history (one JSON object per line)."""
 
 AUDIT_LOG_PATH: Path = _BASE / "audit_log.jsonl"
 """Append-only decision audit trail."""
@@ -36,30 +78,57 @@ AUDIT_LOG_PATH: Path = _BASE / "audit_log.jsonl"
 # JSON read / write helpers
 # ---------------------------------------------------------------------------
 
+# Parsed-JSON cache keyed by path.  Each entry stores the file's
+# (mtime_ns, size) stamp alongside the parsed dict; a stamp mismatch on
+# read invalidates the entry, and write_json refreshes it directly, so
+# repeated reads of an unchanged file cost one stat() instead of a full
+# open + parse.
+_JSON_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
 def read_json(path: Path) -> dict[str, Any]:
     """Read a JSON file and return its contents as a dict.
 
     Handles missing files, corrupt JSON, and permission errors gracefully.
     If the file does not exist it is created with an empty ``{}``.
 
+    Repeated reads of an unchanged file are served from an in-process
+    cache invalidated on mtime/size change.  Callers that mutate the
+    returned dict must persist it back via :func:`write_json` (every
+    caller in ``tools.py`` already does).
+
     Args:
         path: Absolute path to the JSON file.
 
     Returns:
         Parsed dict.  Returns ``{}`` on any read/parse failure.
     """
+    # EAFP: one stat() on the hot path (file exists) instead of the old
+    # exists() + stat() pair; the missing-file branch pays the setup cost.
     try:
-        if not path.exists():
+        stat = path.stat()
+    except FileNotFoundError:
+        try:
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_text("{}", encoding="utf-8")
-            return {}
-        with open(path, encoding="utf-8") as fh:
-            data = json.load(fh)
-        if isinstance(data, dict):
-            return data
+        except OSError:
+            pass
         return {}
+    except OSError:
+        return {}
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, "rb") as fh:
+            data = _loads(fh.read())
     except (json.JSONDecodeError, OSError):
         return {}
+    if isinstance(data, dict):
+        _JSON_CACHE[path] = (stamp, data)
+        return data
+    return {}
 
 
 def write_json(path: Path, data: dict[str, Any]) -> str | None:
@@ -69,22 +138,219 @@ def write_json(path: Path, data: dict[str, Any]) -> str | None:
         path: Absolute path to the JSON file.
         data: Dict to serialise.
 
+    The payload is serialised to bytes first and written to a sibling
+    ``.tmp`` file that is atomically renamed over the target, so readers
+    never observe a torn or half-written file.
+
     Returns:
         ``None`` on success, or a human-readable error string on failure.
     """
+    tmp = path.with_suffix(path.suffix + ".tmp")
     try:
+        buf = _dumps_indented(data)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, ensure_ascii=False)
+        with open(tmp, "wb") as fh:
+            fh.write(buf)
+        os.replace(tmp, path)
+        stat = path.stat()
+        _JSON_CACHE[path] = ((stat.st_mtime_ns, stat.st_size), data)
         return None
     except (OSError, TypeError, ValueError) as exc:
+        _JSON_CACHE.pop(path, None)
         return f"File write error ({path.name}): {exc}"
 
 
+# Serialises read-modify-write cycles on the structured store.  The CLI
+# fans independent tool calls out on a thread pool, so two writers could
+# otherwise interleave between read and write and drop an update.
+_UPDATE_LOCK = threading.Lock()
+
+
+def update_json(path: Path, mutate: Callable[[dict[str, Any]], None]) -> str | None:
+    """Read a JSON file, apply *mutate* to the dict, and write it back.
+
+    One call replaces the read_json → mutate → write_json sequence every
+    writer used to spell out, and the internal lock makes the whole
+    cycle atomic with respect to other threads in this process.
+
+    Args:
+        path:   Absolute path to the JSON file.
+        mutate: Callable that mutates the parsed dict in place.
+
+    Returns:
+        ``None`` on success, or the error string from :func:`write_json`.
+    """
+    with _UPDATE_LOCK:
+        store = read_json(path)
+        mutate(store)
+        return write_json(path, store)
+
+
+# ---------------------------------------------------------------------------
+# Order history  (append-only NDJSON)
+# ---------------------------------------------------------------------------
+
+def append_order(order: dict[str, Any]) -> str | None:
+    """Append one confirmed order to ``orders.ndjson``.
+
+    Orders are immutable once placed, so the history is an append-only
+    NDJSON file: each confirmation writes one line, O(1) regardless of
+    how large the history has grown.  Rules stay in ``memory_store.json``.
+
+    Args:
+        order: Order dict (vendor, price, quantity, status, …).
+
+    Returns:
+        ``None`` on success, or a human-readable error string on failure.
+    """
+    try:
+        with open(ORDERS_PATH, "ab") as fh:
+            fh.write(_dumps_line(order))
+        return None
+    except (OSError, TypeError, ValueError) as exc:
+        return f"File write error ({ORDERS_PATH.name}): {exc}"
+
+
+def read_orders() -> list[dict[str, Any]]:
+    """Return every confirmed order from ``orders.ndjson``, oldest first.
+
+    Returns:
+        List of order dicts; ``[]`` if the file is missing or empty.
+        Corrupt lines are skipped rather than raising.
+    """
+    try:
+        data = ORDERS_PATH.read_bytes()
+    except OSError:
+        return []
+    orders: list[dict[str, Any]] = []
+    for line in data.splitlines():
+        if not line:
+            continue
+        try:
+            orders.append(_loads(line))
+        except (json.JSONDecodeError, ValueError):
+            continue
+    return orders
+
+
 # ---------------------------------------------------------------------------
 # Audit logging  (append-only JSONL)
 # ---------------------------------------------------------------------------
 
+# Timestamps are ISO-8601 UTC, identical in shape to
+# ``datetime.now(timezone.utc).isoformat()``.  The seconds-resolution
+# prefix only changes once per second, so it is cached and each entry
+# formats just the microsecond tail instead of building a full datetime.
+# The (second, prefix) pair lives in ONE tuple so concurrent callers
+# (cmd_order / batch_invoke thread pools) always see a matching pair —
+# tuple assignment is atomic, two separate globals would not be.
+_TS_STATE: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ``YYYY-MM-DDTHH:MM:SS.ffffff+00:00``."""
+    global _TS_STATE
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _TS_STATE
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_STATE = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
+
+
+# Audit entries go through a lazily-opened buffered handle, so a burst of
+# events (filter_vendors can log several rejections per call) costs one
+# buffered write each instead of an open + write + close round-trip per
+# event.  The handle remembers which path it was opened for: repointing
+# ``AUDIT_LOG_PATH`` (the test suite does exactly that) closes the old
+# handle — flushing its buffer — and reopens against the new path.
+_LOG_FH: Any = None
+_LOG_FH_PATH: Path | None = None
+_LOG_BUFFER_SIZE: int = 65536
+
+
+def _log_handle() -> Any:
+    """Return the buffered append handle for the current audit-log path."""
+    global _LOG_FH, _LOG_FH_PATH
+    if _LOG_FH is None or _LOG_FH_PATH != AUDIT_LOG_PATH:
+        close_audit_log()
+        AUDIT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _LOG_FH = open(AUDIT_LOG_PATH, "ab", buffering=_LOG_BUFFER_SIZE)
+        _LOG_FH_PATH = AUDIT_LOG_PATH
+    return _LOG_FH
+
+
+# Audit writes happen off the caller's critical path: log_decision /
+# log_decisions_batch serialise the entry and enqueue the bytes; a daemon
+# thread drains the bounded queue and writes through the shared handle.
+# A full queue makes the producer block (backpressure) rather than drop
+# or reorder entries.  flush_audit_log drains the queue before flushing,
+# so every read still observes all prior writes deterministically.
+_AUDIT_QUEUE: "queue.Queue[bytes]" = queue.Queue(maxsize=10_000)
+_WRITE_LOCK = threading.Lock()
+_WRITER_BATCH: int = 256
+
+
+def _audit_writer() -> None:
+    """Daemon loop: drain queued audit lines in batches of up to 256."""
+    while True:
+        chunks: list[bytes] = [_AUDIT_QUEUE.get()]
+        try:
+            while len(chunks) < _WRITER_BATCH:
+                chunks.append(_AUDIT_QUEUE.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            with _WRITE_LOCK:
+                _log_handle().write(b"".join(chunks))
+        except OSError:
+            pass  # audit logging must never crash anything
+        finally:
+            for _ in chunks:
+                _AUDIT_QUEUE.task_done()
+
+
+_WRITER_THREAD = threading.Thread(
+    target=_audit_writer, name="audit-log-writer", daemon=True,
+)
+_WRITER_THREAD.start()
+
+
+def flush_audit_log() -> None:
+    """Drain queued audit entries and flush the handle to disk.
+
+    Called automatically before any read of the log and at interpreter
+    exit.  Safe to call when nothing is pending.
+    """
+    _AUDIT_QUEUE.join()
+    with _WRITE_LOCK:
+        if _LOG_FH is not None:
+            try:
+                _LOG_FH.flush()
+            except OSError:
+                pass
+
+
+def close_audit_log() -> None:
+    """Flush and close the audit-log handle.
+
+    The next :func:`log_decision` reopens it lazily.  Closing before
+    :func:`clear_audit_log` unlinks the file keeps Windows happy, where
+    deleting an open file fails.
+    """
+    global _LOG_FH, _LOG_FH_PATH
+    if _LOG_FH is not None:
+        try:
+            _LOG_FH.close()
+        except OSError:
+            pass
+        _LOG_FH = None
+        _LOG_FH_PATH = None
+
+
+atexit.register(flush_audit_log)
+
+
 def log_decision(event_type: str, site_name: str, details: dict[str, Any]) -> None:
     """Append a single audit entry to ``audit_log.jsonl``.
 
@@ -105,42 +371,185 @@ def log_decision(event_type: str, site_name: str, details: dict[str, Any]) -> No
         site_name:  Construction site this decision relates to.
         details:    Free-form dict with context (vendor, price, reason …).
     """
+    # Intern the two low-cardinality keys at the write side too, so the
+    # in-memory entry (and any caller holding on to it) shares one copy
+    # per distinct event type / site name.
     entry: dict[str, Any] = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "event_type": event_type,
-        "site_name": site_name,
+        "timestamp": _utc_timestamp(),
+        "event_type": sys.intern(event_type),
+        "site_name": sys.intern(site_name),
         "details": details,
     }
+    global _AUDIT_CACHE
+    _AUDIT_CACHE = None
+    # Hand the serialised line to the writer thread; the caller returns
+    # without touching the disk.  put() blocks only if 10k lines are
+    # already pending, which keeps ordering intact under backpressure.
+    _AUDIT_QUEUE.put(_dumps_line(entry))
+
+
+def log_decisions_batch(events: list[tuple[str, str, dict[str, Any]]]) -> None:
+    """Append several audit entries with a single buffered write.
+
+    Multi-event bursts (rules stored, vendors rejected, order placed) can
+    hand all their entries over at once instead of paying a write per
+    event.  The batch is one logical moment, so every entry shares a
+    single timestamp instead of re-deriving it per event.
+
+    Args:
+        events: ``(event_type, site_name, details)`` tuples, appended to
+            the log in the given order.
+    """
+    global _AUDIT_CACHE
+    if not events:
+        return
+    _AUDIT_CACHE = None
+    ts = _utc_timestamp()
+    lines = [
+        _dumps_line({
+            "timestamp": ts,
+            "event_type": sys.intern(event_type),
+            "site_name": sys.intern(site_name),
+            "details": details,
+        })
+        for event_type, site_name, details in events
+    ]
+    # One queue item per batch keeps the burst contiguous in the log.
+    _AUDIT_QUEUE.put(b"".join(lines))
+
+
+def iter_audit_log(event_types: set[str] | None = None) -> Iterator[dict[str, Any]]:
+    """Yield entries from ``audit_log.jsonl`` one at a time.
+
+    Constant-memory alternative to :func:`read_audit_log` for consumers
+    that render entries as they go or stop early — the JSONL format means
+    each line parses independently, so nothing needs materialising.
+
+    When *event_types* is given, lines that cannot contain a wanted type
+    are skipped with a cheap substring check before any JSON parsing.
+    The parsed entry is still confirmed against the set, so a matching
+    value buried in some other field cannot slip through.
+
+    Args:
+        event_types: Optional set of event types to yield; ``None``
+            yields every entry.
+
+    Yields:
+        One dict per logged event, in chronological order.  Yields nothing
+        if the file is missing; stops at the first corrupt line.
+    """
+    flush_audit_log()
+    needles: tuple[bytes, ...] | None = None
+    if event_types is not None:
+        needles = tuple(f'"{t}"'.encode("utf-8") for t in event_types)
+    # Memory-map the log instead of read()ing it: the kernel pages bytes
+    # in on demand, so a multi-MB history costs no up-front copy and a
+    # consumer that stops early never touches the tail.  _loads takes the
+    # sliced line bytes directly.
     try:
-        AUDIT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(AUDIT_LOG_PATH, "a", encoding="utf-8") as fh:
-            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
-    except OSError:
-        pass  # audit logging must never crash a tool call
+        with open(AUDIT_LOG_PATH, "rb") as fh:
+            try:
+                buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # zero-length file cannot be mapped
+                return
+            with buf:
+                start = 0
+                size = len(buf)
+                while start < size:
+                    end = buf.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    line = buf[start:end].strip()
+                    start = end + 1
+                    if not line:
+                        continue
+                    if needles is not None and not any(n in line for n in needles):
+                        continue
+                    entry = _loads(line)
+                    if event_types is None or entry.get("event_type") in event_types:
+                        yield _intern_entry(entry)
+    except (OSError, json.JSONDecodeError):
+        return
+
+
+def _intern_entry(entry: dict[str, Any]) -> dict[str, Any]:
+    """Intern the low-cardinality string fields of a parsed audit entry.
+
+    ``event_type`` and ``site_name`` come from a tiny fixed vocabulary,
+    but each parse allocates fresh strings; interning lets downstream
+    equality checks take the pointer-compare fast path.
+    """
+    value = entry.get("event_type")
+    if type(value) is str:
+        entry["event_type"] = sys.intern(value)
+    value = entry.get("site_name")
+    if type(value) is str:
+        entry["site_name"] = sys.intern(value)
+    return entry
+
+
+# Parsed-log cache, same (path, mtime_ns, size) stamping as _JSON_CACHE:
+# repeated reads of an unchanged log (the demo summary, the edge-case
+# harness) cost one stat() instead of a full read + parse.  Writers also
+# drop the cache explicitly, belt-and-braces against filesystems with
+# coarse mtime resolution.
+_AUDIT_CACHE: tuple[Path, int, int, list[dict[str, Any]]] | None = None
 
 
 def read_audit_log() -> list[dict[str, Any]]:
     """Read every entry from ``audit_log.jsonl``.
 
+    Reads the whole file in one ``read_bytes()`` and parses per line over
+    ``splitlines()`` — no text-mode decoding, no per-line ``strip()``,
+    and with orjson present the parse itself runs in C.  Repeated reads
+    of an unchanged log are served from an in-process cache.  Use
+    :func:`iter_audit_log` instead when streaming or early exit matters.
+
     Returns:
         A list of dicts (one per logged event), in chronological order.
-        Returns an empty list if the file is missing or empty.
+        Returns an empty list if the file is missing, empty, or corrupt.
     """
-    entries: list[dict[str, Any]] = []
+    global _AUDIT_CACHE
+    flush_audit_log()
+    try:
+        stat = AUDIT_LOG_PATH.stat()
+    except OSError:
+        return []
+    cached = _AUDIT_CACHE
+    if (
+        cached is not None
+        and cached[0] == AUDIT_LOG_PATH
+        and cached[1] == stat.st_mtime_ns
+        and cached[2] == stat.st_size
+    ):
+        return cached[3]
     try:
-        with open(AUDIT_LOG_PATH, encoding="utf-8") as fh:
-            for line in fh:
-                stripped = line.strip()
-                if stripped:
-                    entries.append(json.loads(stripped))
+        data = AUDIT_LOG_PATH.read_bytes()
+        entries = [_intern_entry(_loads(line)) for line in data.splitlines() if line]
     except (FileNotFoundError, json.JSONDecodeError):
-        pass
+        return []
+    _AUDIT_CACHE = (AUDIT_LOG_PATH, stat.st_mtime_ns, stat.st_size, entries)
     return entries
 
 
-def clear_audit_log() -> None:
-    """Delete ``audit_log.jsonl`` so the next run starts with a clean slate."""
+def clear_orders() -> None:
+    """Delete ``orders.ndjson`` so the next run starts with a clean slate."""
     try:
-        AUDIT_LOG_PATH.unlink(missing_ok=True)
+        ORDERS_PATH.unlink(missing_ok=True)
     except OSError:
         pass
+
+
+def clear_audit_log() -> None:
+    """Delete ``audit_log.jsonl`` so the next run starts with a clean slate."""
+    global _AUDIT_CACHE
+    _AUDIT_CACHE = None
+    # Let queued entries land first so the writer thread cannot resurrect
+    # the file with stale lines after the unlink.
+    _AUDIT_QUEUE.join()
+    with _WRITE_LOCK:
+        close_audit_log()
+        try:
+            AUDIT_LOG_PATH.unlink(missing_ok=True)
+        except OSError:
+            pass
@@ -8,8 +8,10 @@ Run with:  ``pytest test_tools.py -v``
 """
 
 import json
+import os
+import shutil
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import pytest
 
@@ -56,8 +58,25 @@ SAMPLE_VENDORS: dict[str, Any] = {
 }
 
 
+@pytest.fixture(scope="session")
+def _vendor_seed(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Serialise ``SAMPLE_VENDORS`` once for the whole session.
+
+    The per-test fixture hardlinks this file instead of re-running
+    ``json.dumps`` + ``write_text`` for every test.  It is made read-only
+    so a test that wants different catalog contents must unlink its link
+    first — writing through the link would poison every later test.
+    """
+    seed = tmp_path_factory.mktemp("vendor_seed") / "mock_vendors.json"
+    seed.write_text(json.dumps(SAMPLE_VENDORS), encoding="utf-8")
+    seed.chmod(0o444)
+    return seed
+
+
 @pytest.fixture(autouse=True)
-def _isolate_file_io(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def _isolate_file_io(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, _vendor_seed: Path,
+) -> Iterator[None]:
     """Redirect all file paths in the ``memory`` module to a temporary directory.
 
     Since tools.py accesses paths via ``import memory as _mem; _mem.MEMORY_PATH``,
@@ -66,9 +85,14 @@ def _isolate_file_io(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     tmp_memory = tmp_path / "memory_store.json"
     tmp_vendors = tmp_path / "mock_vendors.json"
     tmp_audit = tmp_path / "audit_log.jsonl"
+    tmp_orders = tmp_path / "orders.ndjson"
 
-    # Seed the vendor catalog so fetch_vendors works
-    tmp_vendors.write_text(json.dumps(SAMPLE_VENDORS), encoding="utf-8")
+    # Seed the vendor catalog so fetch_vendors works — hardlink the
+    # session seed, falling back to a copy where links are unsupported.
+    try:
+        os.link(_vendor_seed, tmp_vendors)
+    except OSError:
+        shutil.copyfile(_vendor_seed, tmp_vendors)
 
     # Seed empty memory
     tmp_memory.write_text("{}", encoding="utf-8")
@@ -77,6 +101,14 @@ def _isolate_file_io(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     monkeypatch.setattr(mem, "MEMORY_PATH", tmp_memory)
     monkeypatch.setattr(mem, "VENDORS_PATH", tmp_vendors)
     monkeypatch.setattr(mem, "AUDIT_LOG_PATH", tmp_audit)
+    monkeypatch.setattr(mem, "ORDERS_PATH", tmp_orders)
+
+    yield
+
+    # Drain the background audit writer before monkeypatch restores the
+    # paths, so a test's queued entries cannot land in the next test's
+    # (or the real) audit file.
+    mem.flush_audit_log()
 
 
 # ===================================================================
@@ -239,6 +271,7 @@ class TestFetchVendors:
 
     def test_fetch_with_empty_catalog(self) -> None:
         """An empty vendor catalog file returns an empty list."""
+        mem.VENDORS_PATH.unlink()  # break the hardlink to the shared seed
         mem.VENDORS_PATH.write_text("{}", encoding="utf-8")
 
         vendors = tools.fetch_vendors("cement")
@@ -247,12 +280,40 @@ class TestFetchVendors:
 
     def test_fetch_with_corrupt_json(self) -> None:
         """A corrupt vendor file returns an empty list (graceful fallback)."""
+        mem.VENDORS_PATH.unlink()  # break the hardlink to the shared seed
         mem.VENDORS_PATH.write_text("NOT VALID JSON!!!", encoding="utf-8")
 
         vendors = tools.fetch_vendors("cement")
 
         assert vendors == []
 
+    def test_repeat_fetch_served_from_cache(self) -> None:
+        """Repeat fetches return equal results but independent lists."""
+        first = tools.fetch_vendors("cement")
+        second = tools.fetch_vendors("cement")
+
+        assert first == second
+        assert first is not second  # callers may mutate their copy
+
+    def test_fetch_result_mutation_does_not_poison_cache(self) -> None:
+        """Mutating a returned vendor dict must not leak into later fetches."""
+        first = tools.fetch_vendors("cement")
+        first[0]["name"] = "Mutated Cements"
+        first[0]["price_per_100_bags_inr"] = 1
+
+        second = tools.fetch_vendors("cement")
+
+        assert second[0]["name"] != "Mutated Cements"
+
+    def test_invalidate_vendor_cache(self) -> None:
+        """The invalidation hook clears the category index."""
+        tools.fetch_vendors("cement")
+        assert tools._CATEGORY_INDEX
+
+        tools._invalidate_vendor_cache()
+
+        assert not tools._CATEGORY_INDEX
+
 
 # ===================================================================
 # filter_vendors
@@ -307,6 +368,14 @@ class TestFilterVendors:
         prices = [v["price_per_100_bags_inr"] for v in result["eligible"]]
         assert prices == sorted(prices)
 
+    def test_filter_over_budget_sorted_by_price(self) -> None:
+        """Over-budget vendors should also be sorted cheapest-first."""
+        vendors = self._get_vendors()
+        result = tools.filter_vendors(vendors, [], 1000)
+
+        prices = [o["price"] for o in result["over_budget"]]
+        assert prices == sorted(prices)
+
     def test_filter_all_blacklisted_gives_message(self) -> None:
         """When all vendors are blacklisted, a diagnostic message is present."""
         vendors = self._get_vendors()
@@ -384,14 +453,13 @@ class TestPlaceOrder:
         assert "35,000" in result
 
     def test_order_within_budget_saves_to_memory(self) -> None:
-        """An auto-approved order is persisted in memory_store.json."""
+        """An auto-approved order is persisted in orders.ndjson."""
         tools.place_order("BadRock Cements", 35000, 100, "cement", "Site-1", 50000)
 
-        data = json.loads(mem.MEMORY_PATH.read_text(encoding="utf-8"))
-        assert "orders" in data
-        assert len(data["orders"]) == 1
-        assert data["orders"][0]["vendor_name"] == "BadRock Cements"
-        assert data["orders"][0]["status"] == "confirmed"
+        orders = mem.read_orders()
+        assert len(orders) == 1
+        assert orders[0]["vendor_name"] == "BadRock Cements"
+        assert orders[0]["status"] == "confirmed"
 
     def test_order_over_budget_requests_approval(self) -> None:
         """An order exceeding the limit returns APPROVAL_REQUIRED."""
@@ -404,13 +472,12 @@ class TestPlaceOrder:
         assert "40,000" in result
 
     def test_order_over_budget_not_saved(self) -> None:
-        """An over-budget order should NOT be saved to memory_store.json."""
+        """An over-budget order should NOT be saved to orders.ndjson."""
         tools.place_order(
             "GoodRock Cements", 45000, 100, "cement", "Site-1", 40000
         )
 
-        data = json.loads(mem.MEMORY_PATH.read_text(encoding="utf-8"))
-        assert data.get("orders", []) == []
+        assert mem.read_orders() == []
 
     def test_order_at_exact_limit_auto_approves(self) -> None:
         """An order at exactly the approval limit should auto-approve."""
@@ -460,9 +527,9 @@ class TestConfirmOrder:
         assert result.startswith("ORDER_CONFIRMED")
         assert "Human-approved" in result
 
-        data = json.loads(mem.MEMORY_PATH.read_text(encoding="utf-8"))
-        assert len(data["orders"]) == 1
-        assert data["orders"][0]["status"] == "confirmed_with_approval"
+        orders = mem.read_orders()
+        assert len(orders) == 1
+        assert orders[0]["status"] == "confirmed_with_approval"
 
     def test_confirm_logs_order_placed_human(self) -> None:
         """confirm_order should log an order_placed entry with approval=human."""
@@ -475,6 +542,45 @@ class TestConfirmOrder:
         assert placed[0]["details"]["approval"] == "human"
 
 
+# ===================================================================
+# batch_invoke
+# ===================================================================
+
+
+class TestBatchInvoke:
+    """Tests for batch_invoke."""
+
+    def test_batch_preserves_input_order(self) -> None:
+        """Results come back in the same order as the invocations."""
+        results = tools.batch_invoke([
+            {"tool_name": "fetch_vendors", "arguments": {"material": "cement"}},
+            {"tool_name": "retrieve_site_rules", "arguments": {"site_name": "Ghost"}},
+        ])
+
+        assert [r["tool_name"] for r in results] == [
+            "fetch_vendors", "retrieve_site_rules",
+        ]
+        assert len(results[0]["result"]) == 3
+        assert "error" in results[1]["result"]  # no rules stored for 'Ghost'
+
+    def test_batch_rejects_non_batchable_tool(self) -> None:
+        """Order-placing tools cannot be fanned out."""
+        results = tools.batch_invoke([{"tool_name": "place_order", "arguments": {}}])
+
+        assert "error" in results[0]
+        assert "place_order" in results[0]["error"]
+
+    def test_batch_invalid_arguments_yield_error(self) -> None:
+        """A bad argument set produces an error entry, not an exception."""
+        results = tools.batch_invoke([{"tool_name": "fetch_vendors", "arguments": {}}])
+
+        assert "error" in results[0]
+
+    def test_batch_empty_list(self) -> None:
+        """An empty batch returns an empty list."""
+        assert tools.batch_invoke([]) == []
+
+
 # ===================================================================
 # Audit log utilities (tested via memory module)
 # ===================================================================
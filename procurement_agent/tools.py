@@ -4,8 +4,14 @@ Pure business logic — no LLM calls, no direct file I/O.  All persistence
 is delegated to the ``memory`` module.
 
 Dependencies: ``memory`` module (project-local) + standard library only.
+NumPy is used opportunistically when installed (large-catalog filtering);
+everything works without it.
 """
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any
 
 try:
@@ -13,6 +19,59 @@ try:
 except ImportError:
     import memory as _mem  # direct execution (python tools.py)
 
+try:
+    import numpy as _np  # optional: vectorised filtering for large catalogs
+except ImportError:
+    _np = None
+
+# Below this many vendors the pure-Python comprehensions beat NumPy's
+# array-construction overhead, so the vectorised path only kicks in for
+# genuinely large (multi-tenant) catalogs.
+_VECTORIZE_MIN_VENDORS = 32
+
+
+def _path_stamp(path: Any) -> tuple[str, int, int] | None:
+    """Return a file's (path, mtime_ns, size) identity, or None if unstatable."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4096)
+def _inr(n: int) -> str:
+    """Format an integer rupee amount with thousands separators (``₹{n:,}``).
+
+    Prices and approval limits come from a small value domain, so the
+    cache turns repeated thousands-separator formatting into a dict hit.
+    """
+    return f"₹{n:,}"
+
+
+@functools.lru_cache(maxsize=256)
+def _approval_suffix(approval_limit: int) -> str:
+    """Cached auto-approval suffix — the limit is constant per site."""
+    return f"Within approval limit of {_inr(approval_limit)}."
+
+
+@functools.lru_cache(maxsize=256)
+def _approval_request_tail(price: int, approval_limit: int) -> str:
+    """Cached numeric tail of the ``APPROVAL_REQUIRED`` message.
+
+    Parameterised by ``(price, limit)`` only — the vendor line above it
+    varies per call and is composed by the caller.
+    """
+    overage = price - approval_limit
+    percentage = round((overage / approval_limit) * 100, 1)
+    return (
+        f"  Cost: {_inr(price)}\n"
+        f"  Limit: {_inr(approval_limit)}\n"
+        f"  Overage: {_inr(overage)} ({percentage}%)\n"
+        "\n"
+        "Approve this order?"
+    )
+
 
 # ---------------------------------------------------------------------------
 # 1. store_site_rules
@@ -57,24 +116,31 @@ def store_site_rules(
     if not site_key:
         return "Error: site_name must be a non-empty string."
 
-    store = _mem.read_json(_mem.MEMORY_PATH)
-    store[site_key] = {
+    rules: dict[str, Any] = {
         "approval_limit": approval_limit,
         "vendor_blacklist": [v.strip() for v in vendor_blacklist],
     }
-    write_err = _mem.write_json(_mem.MEMORY_PATH, store)
+    write_err = _mem.update_json(
+        _mem.MEMORY_PATH, lambda store: store.update({site_key: rules}),
+    )
     if write_err:
         return f"Error saving rules: {write_err}"
 
+    # Seed the read cache: existing entries stay valid (the write only
+    # touched this site), so just refresh the stamp alongside.
+    global _RULES_STAMP
+    _RULES_STAMP = _path_stamp(_mem.MEMORY_PATH)
+    _RULES_CACHE[site_key] = rules
+
     _mem.log_decision("rules_stored", site_key, {
         "approval_limit": approval_limit,
-        "vendor_blacklist": store[site_key]["vendor_blacklist"],
+        "vendor_blacklist": rules["vendor_blacklist"],
     })
 
     blacklist_display = ", ".join(vendor_blacklist) if vendor_blacklist else "(none)"
     return (
         f"Rules stored for site '{site_key}': "
-        f"approval_limit=₹{approval_limit:,}, "
+        f"approval_limit={_inr(approval_limit)}, "
         f"vendor_blacklist=[{blacklist_display}]."
     )
 
@@ -83,6 +149,14 @@ def store_site_rules(
 # 2. retrieve_site_rules
 # ---------------------------------------------------------------------------
 
+# Per-site rules cache.  Rules only change through store_site_rules (which
+# seeds the cache), but the store file can still be edited externally, so
+# entries are only trusted while the file's identity stamp matches — any
+# external write invalidates everything.
+_RULES_STAMP: tuple[str, int, int] | None = None
+_RULES_CACHE: dict[str, dict[str, Any]] = {}
+
+
 def retrieve_site_rules(site_name: str) -> dict[str, Any]:
     """Retrieve stored procurement rules for a given site.
 
@@ -104,13 +178,26 @@ def retrieve_site_rules(site_name: str) -> dict[str, Any]:
         >>> retrieve_site_rules("")
         {'error': 'site_name must be a non-empty string.'}
     """
+    global _RULES_STAMP
+
     site_key = site_name.strip()
     if not site_key:
         return {"error": "site_name must be a non-empty string."}
 
+    stamp = _path_stamp(_mem.MEMORY_PATH)
+    if stamp != _RULES_STAMP:
+        _RULES_CACHE.clear()
+        _RULES_STAMP = stamp
+    else:
+        cached = _RULES_CACHE.get(site_key)
+        if cached is not None:
+            return cached
+
     store = _mem.read_json(_mem.MEMORY_PATH)
     rules = store.get(site_key)
     if isinstance(rules, dict) and "approval_limit" in rules:
+        if stamp is not None:
+            _RULES_CACHE[site_key] = rules
         return rules
     return {
         "error": (
@@ -124,6 +211,56 @@ def retrieve_site_rules(site_name: str) -> dict[str, Any]:
 # 3. fetch_vendors
 # ---------------------------------------------------------------------------
 
+# Category index over the vendor catalog — material lookups become one
+# dict probe instead of a linear scan.  _CATALOG_STAMP tracks the catalog
+# file's (path, mtime_ns, size); any change rebuilds the index so edits
+# to mock_vendors.json are picked up immediately.  _AVAILABLE_CATEGORIES
+# keeps the sorted original-case names for the no-match audit warning.
+_CATALOG_STAMP: tuple[str, int, int] | None = None
+_CATEGORY_INDEX: dict[str, list[dict[str, Any]]] = {}
+_AVAILABLE_CATEGORIES: list[str] = []
+
+
+def _catalog_stamp() -> tuple[str, int, int] | None:
+    """Return the vendor catalog's current identity stamp."""
+    return _path_stamp(_mem.VENDORS_PATH)
+
+
+def _rebuild_catalog_index() -> None:
+    """Re-read the catalog and rebuild the category index in place."""
+    _CATEGORY_INDEX.clear()
+    data = _mem.read_json(_mem.VENDORS_PATH)
+    categories: set[str] = set()
+    for v in data.get("vendors", []):
+        # Normalise each name once here so filter_vendors' hot loop does
+        # a plain set lookup instead of strip().lower() per vendor.
+        v["_name_lc"] = v.get("name", "").strip().lower()
+        # Guarantee the price field so sort keys can subscript directly.
+        v.setdefault("price_per_100_bags_inr", 0)
+        category = v.get("category", "unknown")
+        categories.add(category)
+        _CATEGORY_INDEX.setdefault(category.strip().lower(), []).append(v)
+    # Pre-sort each category cheapest-first: filter_vendors receives its
+    # input already in price order, so its contract sort degenerates to
+    # Timsort's O(N) verification pass instead of a real sort.
+    for vendors in _CATEGORY_INDEX.values():
+        vendors.sort(key=itemgetter("price_per_100_bags_inr"))
+    _AVAILABLE_CATEGORIES[:] = sorted(categories)
+
+
+def _invalidate_vendor_cache() -> None:
+    """Drop the cached catalog state so the next fetch re-reads the file.
+
+    The stamp check already catches on-disk edits; this hook exists for
+    tests and as an explicit escape hatch for anything else that needs a
+    guaranteed re-read.
+    """
+    global _CATALOG_STAMP
+    _CATALOG_STAMP = None
+    _CATEGORY_INDEX.clear()
+    _AVAILABLE_CATEGORIES.clear()
+
+
 def fetch_vendors(material: str) -> list[dict[str, Any]]:
     """Return all vendors that supply a given material from the catalog.
 
@@ -148,29 +285,89 @@ def fetch_vendors(material: str) -> list[dict[str, Any]]:
         >>> fetch_vendors("CEMENT")  # case-insensitive
         [{'id': 'badrock', 'name': 'BadRock Cements', ...}, ...]
     """
-    data = _mem.read_json(_mem.VENDORS_PATH)
-    all_vendors: list[dict[str, Any]] = data.get("vendors", [])
-    material_lower = material.strip().lower()
-
-    matched = [
-        v for v in all_vendors
-        if v.get("category", "").lower() == material_lower
-    ]
+    global _CATALOG_STAMP
 
-    if not matched:
-        available = sorted({v.get("category", "unknown") for v in all_vendors})
-        _mem.log_decision("vendor_rejected", "", {
-            "reason": f"No vendors found for material '{material}'",
-            "available_categories": available,
-        })
-
-    return matched
+    material_lower = material.strip().lower()
+    stamp = _catalog_stamp()
+    if stamp != _CATALOG_STAMP:
+        _rebuild_catalog_index()
+        _CATALOG_STAMP = stamp
+
+    matched = _CATEGORY_INDEX.get(material_lower)
+    if matched:
+        # Shallow-copy each dict: callers may mutate their result (the
+        # baseline behaviour) without corrupting the cached index.
+        return [dict(v) for v in matched]
+
+    _mem.log_decision("vendor_rejected", "", {
+        "reason": f"No vendors found for material '{material}'",
+        "available_categories": list(_AVAILABLE_CATEGORIES),
+    })
+    return []
 
 
 # ---------------------------------------------------------------------------
 # 4. filter_vendors
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=64)
+def _normalize_blacklist(bl: tuple[str, ...]) -> frozenset[str]:
+    """Lower-case and strip a blacklist once per distinct name tuple.
+
+    An agent looping over materials passes the same site blacklist each
+    call; memoising on the tuple makes the repeat normalisations free.
+    The frozenset scales to large agency blacklists as-is: membership
+    stays O(1) per vendor, and the one-off normalisation cost is already
+    amortised by this cache, so no automaton/regex machinery is needed.
+    """
+    return frozenset(n.strip().lower() for n in bl)
+
+
+def _partition_numpy(
+    vendors: list[dict[str, Any]],
+    blacklist_lower: frozenset[str],
+    budget: int,
+) -> tuple[
+    list[tuple[dict[str, Any], int]],
+    list[tuple[dict[str, Any], int]],
+    list[dict[str, Any]],
+]:
+    """Partition *vendors* via NumPy boolean masks (large catalogs only).
+
+    Builds parallel ``names_lc`` / ``prices`` arrays, derives the
+    blacklist / over-budget / eligible masks in C, and returns
+    ``(rejected, over_budget, eligible)``: the first two as
+    ``(vendor, price)`` record pairs so the caller formats payloads
+    without re-probing dicts, eligible as vendor dicts already ordered
+    cheapest-first via ``argsort``.  Semantics match the pure-Python
+    comprehension path exactly.
+    """
+    names_lc = _np.array(
+        [
+            v.get("_name_lc") or v.get("name", "Unknown").strip().lower()
+            for v in vendors
+        ],
+        dtype=object,
+    )
+    prices = _np.asarray(
+        [v.get("price_per_100_bags_inr", 0) for v in vendors],
+        dtype=_np.int64,
+    )
+    if blacklist_lower:
+        bl_mask = _np.isin(names_lc, list(blacklist_lower))
+    else:
+        bl_mask = _np.zeros(len(vendors), dtype=bool)
+    ob_mask = ~bl_mask & (prices > budget)
+    el_idx = _np.flatnonzero(~bl_mask & (prices <= budget))
+    # Stable argsort keeps ties in catalog order, matching list.sort().
+    el_idx = el_idx[_np.argsort(prices[el_idx], kind="stable")]
+    return (
+        [(vendors[i], int(prices[i])) for i in _np.flatnonzero(bl_mask)],
+        [(vendors[i], int(prices[i])) for i in _np.flatnonzero(ob_mask)],
+        [vendors[i] for i in el_idx],
+    )
+
+
 def filter_vendors(
     vendors: list[dict[str, Any]],
     blacklist: list[str],
@@ -184,11 +381,14 @@ def filter_vendors(
          → added to ``rejected`` and logged as ``vendor_rejected``.
       2. Of the remaining, separate those whose ``price_per_100_bags_inr`` exceeds
          *budget* → added to ``over_budget`` and logged as ``vendor_rejected``.
-      3. Eligible vendors are sorted **ascending** by ``price_per_100_bags_inr``.
+      3. Eligible vendors are sorted **ascending** by ``price_per_100_bags_inr``;
+         ``over_budget`` is likewise sorted cheapest-first, so callers may rely
+         on index 0 being the cheapest in both lists.
 
     Args:
         vendors:   List of vendor dicts (as returned by :func:`fetch_vendors`).
-        blacklist: Vendor names to exclude.
+        blacklist: Vendor names to exclude.  Any iterable of names works;
+            offline callers pass a ``frozenset`` to skip the list walk.
         budget:    Maximum acceptable price per 100 bags (INR).
         site_name: Optional site name for audit-log entries (default ``""``).
 
@@ -211,39 +411,81 @@ def filter_vendors(
         >>> filter_vendors([], [], 100000)
         {'eligible': [], 'rejected': [], 'over_budget': []}
     """
-    blacklist_lower: set[str] = {name.strip().lower() for name in blacklist}
-
-    eligible: list[dict[str, Any]] = []
-    rejected: list[dict[str, Any]] = []
-    over_budget: list[dict[str, Any]] = []
-
-    for v in vendors:
-        name: str = v.get("name", "Unknown")
-        price: int = v.get("price_per_100_bags_inr", 0)
-
-        # Step 1 — blacklist check
-        if name.strip().lower() in blacklist_lower:
-            reason = "Blacklisted for this site"
-            rejected.append({"vendor": name, "reason": reason, "price": price})
-            _mem.log_decision("vendor_rejected", site_name, {
-                "vendor": name, "price": price, "reason": reason,
-            })
-            continue
-
-        # Step 2 — budget check
-        if price > budget:
-            reason = f"Price ₹{price:,} exceeds budget ₹{budget:,}"
-            over_budget.append({"vendor": name, "reason": reason, "price": price})
-            _mem.log_decision("vendor_rejected", site_name, {
-                "vendor": name, "price": price, "reason": reason,
-            })
-            continue
+    blacklist_lower: frozenset[str] = _normalize_blacklist(tuple(blacklist))
+
+    if _np is not None and len(vendors) >= _VECTORIZE_MIN_VENDORS:
+        # Large catalog: push the partitioning down to NumPy boolean
+        # masks — C-loop comparisons instead of per-vendor bytecode.
+        rejected_v, over_budget_v, eligible = _partition_numpy(
+            vendors, blacklist_lower, budget
+        )
+    else:
+        # Project each vendor dict onto a (name_lc, price, vendor) tuple
+        # record once up front — the partition passes below then unpack
+        # C-level tuples instead of re-hashing dict keys per predicate.
+        # The blacklist key is pre-normalised by fetch_vendors; fall back
+        # for hand-built vendor dicts (e.g. via the LLM or tests).
+        records = [
+            (
+                v.get("_name_lc") or v.get("name", "Unknown").strip().lower(),
+                v.get("price_per_100_bags_inr", 0),
+                v,
+            )
+            for v in vendors
+        ]
+        if blacklist_lower:
+            rejected_v = [
+                (v, price) for lc, price, v in records if lc in blacklist_lower
+            ]
+            remaining = [r for r in records if r[0] not in blacklist_lower]
+        else:
+            rejected_v = []
+            remaining = records
+        over_budget_v = [
+            (v, price) for _, price, v in remaining if price > budget
+        ]
+        eligible = [v for _, price, v in remaining if price <= budget]
+
+    # Normalise the price field on eligible hand-built dicts so the
+    # itemgetter sort key can subscript directly.
+    for v in eligible:
+        v.setdefault("price_per_100_bags_inr", 0)
+
+    # Bulk-format the report payloads from the (vendor, price) records.
+    rejected: list[dict[str, Any]] = [
+        {
+            "vendor": v.get("name", "Unknown"),
+            "reason": "Blacklisted for this site",
+            "price": price,
+        }
+        for v, price in rejected_v
+    ]
+    over_budget: list[dict[str, Any]] = [
+        {
+            "vendor": v.get("name", "Unknown"),
+            "reason": f"Price {_inr(price)} exceeds budget {_inr(budget)}",
+            "price": price,
+        }
+        for v, price in over_budget_v
+    ]
 
-        # Step 3 — eligible
-        eligible.append(v)
+    # Rejections are logged as one batch — a catalog-sized burst of
+    # events costs one audit write, not N.
+    if rejected or over_budget:
+        _mem.log_decisions_batch([
+            ("vendor_rejected", site_name, {
+                "vendor": r["vendor"],
+                "price": r["price"],
+                "reason": r["reason"],
+            })
+            for r in rejected + over_budget
+        ])
 
-    # Sort eligible by price ascending (deterministic: stable sort)
-    eligible.sort(key=lambda v: v.get("price_per_100_bags_inr", 0))
+    # Sort both result lists by price ascending (deterministic: stable
+    # sort) — the sorted order is part of the tool contract, so callers
+    # never need to re-sort.
+    eligible.sort(key=itemgetter("price_per_100_bags_inr"))
+    over_budget.sort(key=itemgetter("price"))
 
     result: dict[str, Any] = {
         "eligible": eligible,
@@ -258,10 +500,11 @@ def filter_vendors(
             "No order can be placed. Update the blacklist or add new vendors."
         )
     elif not eligible and over_budget:
-        cheapest = min(over_budget, key=lambda x: x["price"])
+        # Already sorted cheapest-first above — no extra min() scan needed.
+        cheapest = over_budget[0]
         result["message"] = (
-            f"All non-blacklisted vendors exceed the budget of ₹{budget:,}. "
-            f"Cheapest option: {cheapest['vendor']} at ₹{cheapest['price']:,}. "
+            f"All non-blacklisted vendors exceed the budget of {_inr(budget)}. "
+            f"Cheapest option: {cheapest['vendor']} at {_inr(cheapest['price'])}. "
             "Request a budget increase or approve the over-budget order."
         )
 
@@ -307,10 +550,15 @@ def place_order(
         >>> place_order("GoodRock Cements", 45000, 100, "cement", "Site-1", 40000)
         'APPROVAL_REQUIRED\\nOrder Details:\\n  Vendor: GoodRock Cements\\n  Cost: ₹45,000\\n  Limit: ₹40,000\\n  Overage: ₹5,000 (12.5%)\\n\\nApprove this order?'
     """
-    _mem.log_decision("vendor_selected", site_name, {
-        "vendor": vendor_name, "price": price,
-        "quantity": quantity, "material": material,
-    })
+    # A call produces two audit events (selection + outcome); they are
+    # collected and written as one batch so each order costs a single
+    # audit append instead of two.
+    audit_events: list[tuple[str, str, dict[str, Any]]] = [
+        ("vendor_selected", site_name, {
+            "vendor": vendor_name, "price": price,
+            "quantity": quantity, "material": material,
+        }),
+    ]
 
     # --- within budget: auto-approve ---
     if price <= approval_limit:
@@ -322,43 +570,38 @@ def place_order(
             "price_inr": price,
             "status": "confirmed",
         }
-        store = _mem.read_json(_mem.MEMORY_PATH)
-        orders: list[dict[str, Any]] = store.get("orders", [])
-        orders.append(order)
-        store["orders"] = orders
-        write_err = _mem.write_json(_mem.MEMORY_PATH, store)
+        write_err = _mem.append_order(order)
         if write_err:
+            _mem.log_decisions_batch(audit_events)  # selection still happened
             return f"Error saving order: {write_err}"
 
-        _mem.log_decision("order_placed", site_name, {
+        audit_events.append(("order_placed", site_name, {
             "vendor": vendor_name, "price": price,
             "quantity": quantity, "material": material,
             "approval": "auto",
-        })
+        }))
+        _mem.log_decisions_batch(audit_events)
         return (
             f"ORDER_CONFIRMED: Order placed: {quantity} bags {material} "
-            f"from {vendor_name} at ₹{price:,}. "
-            f"Within approval limit of ₹{approval_limit:,}."
+            f"from {vendor_name} at {_inr(price)}. "
+            + _approval_suffix(approval_limit)
         )
 
     # --- over budget: request human approval ---
     overage: int = price - approval_limit
     percentage: float = round((overage / approval_limit) * 100, 1)
 
-    _mem.log_decision("approval_requested", site_name, {
+    audit_events.append(("approval_requested", site_name, {
         "vendor": vendor_name, "price": price,
         "approval_limit": approval_limit,
         "overage": overage, "overage_pct": percentage,
-    })
+    }))
+    _mem.log_decisions_batch(audit_events)
     return (
         "APPROVAL_REQUIRED\n"
         "Order Details:\n"
         f"  Vendor: {vendor_name}\n"
-        f"  Cost: ₹{price:,}\n"
-        f"  Limit: ₹{approval_limit:,}\n"
-        f"  Overage: ₹{overage:,} ({percentage}%)\n"
-        "\n"
-        "Approve this order?"
+        + _approval_request_tail(price, approval_limit)
     )
 
 
@@ -400,11 +643,7 @@ def confirm_order(
         "price_inr": price,
         "status": "confirmed_with_approval",
     }
-    store = _mem.read_json(_mem.MEMORY_PATH)
-    orders: list[dict[str, Any]] = store.get("orders", [])
-    orders.append(order)
-    store["orders"] = orders
-    write_err = _mem.write_json(_mem.MEMORY_PATH, store)
+    write_err = _mem.append_order(order)
     if write_err:
         return f"Error saving order: {write_err}"
 
@@ -415,5 +654,72 @@ def confirm_order(
     })
     return (
         f"ORDER_CONFIRMED: Order placed: {quantity} bags {material} "
-        f"from {vendor_name} at ₹{price:,}. (Human-approved over-budget order.)"
+        f"from {vendor_name} at {_inr(price)}. (Human-approved over-budget order.)"
     )
+
+
+# ---------------------------------------------------------------------------
+# 7. batch_invoke
+# ---------------------------------------------------------------------------
+
+# Read-only tools safe to fan out concurrently.  Order-placing tools are
+# deliberately excluded: they mutate the store and must stay single-call.
+_BATCHABLE_TOOLS: dict[str, Any] = {
+    "retrieve_site_rules": retrieve_site_rules,
+    "fetch_vendors": fetch_vendors,
+    "filter_vendors": filter_vendors,
+}
+
+
+def batch_invoke(invocations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run several independent read-only tool calls concurrently.
+
+    Saves one LLM round-trip per extra call: instead of issuing K sequential
+    tool turns (e.g. ``fetch_vendors("cement")`` then ``fetch_vendors("steel")``),
+    the model issues a single ``batch_invoke`` and the calls fan out on a
+    thread pool.  Results are returned in the same order as *invocations*.
+
+    Only read-only tools may be batched: ``retrieve_site_rules``,
+    ``fetch_vendors`` and ``filter_vendors``.  Order-placing tools must be
+    called individually so the budget gate stays sequential.
+
+    Args:
+        invocations: List of ``{"tool_name": str, "arguments": dict}`` items.
+
+    Returns:
+        A list of ``{"tool_name": str, "result": ...}`` dicts, one per
+        invocation, in input order.  Invalid entries yield an ``"error"``
+        key instead of ``"result"``.
+
+    Examples:
+        >>> batch_invoke([
+        ...     {"tool_name": "retrieve_site_rules", "arguments": {"site_name": "Delhi-Site-7"}},
+        ...     {"tool_name": "fetch_vendors", "arguments": {"material": "cement"}},
+        ... ])
+        [{'tool_name': 'retrieve_site_rules', 'result': {...}}, {'tool_name': 'fetch_vendors', 'result': [...]}]
+
+        >>> batch_invoke([{"tool_name": "place_order", "arguments": {}}])
+        [{'tool_name': 'place_order', 'error': "Tool 'place_order' cannot be batched. Batchable tools: fetch_vendors, filter_vendors, retrieve_site_rules."}]
+    """
+    def _run_one(inv: dict[str, Any]) -> dict[str, Any]:
+        tool_name = str(inv.get("tool_name", ""))
+        tool = _BATCHABLE_TOOLS.get(tool_name)
+        if tool is None:
+            return {
+                "tool_name": tool_name,
+                "error": (
+                    f"Tool '{tool_name}' cannot be batched. "
+                    f"Batchable tools: {', '.join(sorted(_BATCHABLE_TOOLS))}."
+                ),
+            }
+        arguments = inv.get("arguments") or {}
+        try:
+            return {"tool_name": tool_name, "result": tool(**arguments)}
+        except TypeError as exc:
+            return {"tool_name": tool_name, "error": f"Invalid arguments: {exc}"}
+
+    if not invocations:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(invocations))) as ex:
+        return list(ex.map(_run_one, invocations))